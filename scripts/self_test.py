@@ -11,19 +11,53 @@ Usage:
     python meta-process/scripts/self_test.py --files       # File existence only
     python meta-process/scripts/self_test.py --links       # Link checker only
     python meta-process/scripts/self_test.py --install     # Install test only
+    python meta-process/scripts/self_test.py --fail-fast   # Stop at first failing check
+    python meta-process/scripts/self_test.py --force       # Ignore cached results
 """
 
 import argparse
+import hashlib
+import json
+import mmap
 import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 from urllib.parse import urlparse
 
 
+# Directories pruned from framework tree walks (VCS metadata, deps, build output)
+SKIP_DIRS = frozenset(
+    {".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build"}
+)
+
+
+def _cache_dir() -> Path | None:
+    """Per-user cache for results reused across runs, or None if unavailable.
+
+    Resolved on use so runs that never touch the cache never look up HOME.
+    """
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache:
+        base = Path(xdg_cache)
+    else:
+        try:
+            base = Path.home() / ".cache"
+        except (KeyError, RuntimeError):
+            return None
+    # Without a home directory Path.home() can return a relative "~"
+    if not base.is_absolute():
+        return None
+    return base / "meta-process-selftest"
+
+
 def find_framework_root() -> Path:
     """Find meta-process/ directory relative to this script or CWD."""
     # If running from within meta-process/scripts/
@@ -43,156 +77,198 @@ def find_framework_root() -> Path:
 # --- Check 1: File Existence ---
 
 
+def _relative_files(root: Path, subdirs: set[str]) -> set[str]:
+    """Collect files at the top of root and under subdirs as relative paths."""
+    present = {name for name in os.listdir(root) if os.path.isfile(root / name)}
+    for subdir in subdirs:
+        for dirpath, dirnames, filenames in os.walk(root / subdir):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel_dir = Path(dirpath).relative_to(root).as_posix()
+            for name in filenames:
+                present.add(f"{rel_dir}/{name}")
+    return present
+
+
+# install.sh arrays -> (framework directory, label used in error messages)
+INSTALL_ARRAYS = {
+    "CORE_SCRIPTS": ("scripts", "core script"),
+    "FULL_SCRIPTS": ("scripts", "full-mode script"),
+    "WORKTREE_SCRIPTS": ("scripts/worktree-coordination", "worktree script"),
+    "CORE_CLAUDE_HOOKS": ("hooks/claude", "core Claude hook"),
+    "WORKTREE_CLAUDE_HOOKS": (
+        "hooks/claude/worktree-coordination",
+        "worktree Claude hook",
+    ),
+}
+
+
+# Regexes are compiled on first use so --links/--install runs skip them
+@lru_cache(maxsize=None)
+def _install_array_re() -> re.Pattern[str]:
+    """Match a bash array assignment: NAME=( "a" "b" ... )."""
+    return re.compile(r"^\s*([A-Z_]+)=\((.*?)\)", re.MULTILINE | re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def _install_template_re() -> re.Pattern[str]:
+    """Match literal template paths, e.g. "$SCRIPT_DIR/templates/plan.md.template"."""
+    return re.compile(r'"\$SCRIPT_DIR/templates/([^"$*]+)"')
+
+
+def _parse_install_sh(source: str) -> dict[str, list[str]]:
+    """Extract the quoted entries of every bash array declared in install.sh."""
+    arrays: dict[str, list[str]] = {}
+    for match in _install_array_re().finditer(source):
+        arrays[match.group(1)] = re.findall(r'"([^"]+)"', match.group(2))
+    return arrays
+
+
 def check_file_existence(root: Path) -> list[str]:
     """Verify all files referenced by install.sh exist."""
     errors: list[str] = []
-
-    # Core scripts (from install.sh CORE_SCRIPTS array)
-    core_scripts = [
-        "check_plan_tests.py",
-        "check_plan_blockers.py",
-        "complete_plan.py",
-        "parse_plan.py",
-        "sync_plan_status.py",
-        "merge_pr.py",
-        "generate_quiz.py",
-    ]
-    for s in core_scripts:
-        if not (root / "scripts" / s).exists():
-            errors.append(f"Missing core script: scripts/{s}")
-
-    # Full mode scripts
-    full_scripts = [
-        "check_doc_coupling.py",
-        "sync_governance.py",
-        "check_mock_usage.py",
-        "check_locked_files.py",
-    ]
-    for s in full_scripts:
-        if not (root / "scripts" / s).exists():
-            errors.append(f"Missing full-mode script: scripts/{s}")
-
-    # Worktree coordination scripts
-    wt_scripts = [
-        "check_claims.py",
-        "safe_worktree_remove.py",
-        "finish_pr.py",
-        "meta_status.py",
-        "check_messages.py",
-        "send_message.py",
-    ]
-    for s in wt_scripts:
-        if not (root / "scripts" / "worktree-coordination" / s).exists():
-            errors.append(
-                f"Missing worktree script: scripts/worktree-coordination/{s}"
-            )
-
-    # Git hooks
+    install_source = (root / "install.sh").read_text()
+    arrays = _parse_install_sh(install_source)
+
+    # Expected framework path -> label, in report order
+    expected: dict[str, str] = {}
+    for name, (directory, label) in INSTALL_ARRAYS.items():
+        if name not in arrays:
+            errors.append(f"install.sh no longer defines {name}")
+            continue
+        for entry in arrays[name]:
+            expected.setdefault(f"{directory}/{entry}", label)
+
+    # Git hooks (install.sh loops over these inline rather than via an array)
     for hook in ["pre-commit", "commit-msg", "post-commit"]:
-        if not (root / "hooks" / "git" / hook).exists():
-            errors.append(f"Missing git hook: hooks/git/{hook}")
-
-    # Core Claude hooks
-    core_hooks = [
-        "protect-main.sh",
-        "check-hook-enabled.sh",
-        "check-references-reviewed.sh",
-        "track-reads.sh",
-        "gate-edit.sh",
-        "post-edit-quiz.sh",
-    ]
-    for h in core_hooks:
-        if not (root / "hooks" / "claude" / h).exists():
-            errors.append(f"Missing core Claude hook: hooks/claude/{h}")
-
-    # Worktree coordination Claude hooks
-    wt_hooks = [
-        "protect-main.sh",
-        "block-cd-worktree.sh",
-        "block-worktree-remove.sh",
-        "check-cwd-valid.sh",
-        "warn-worktree-cwd.sh",
-        "check-file-scope.sh",
-        "enforce-make-merge.sh",
-        "check-inbox.sh",
-        "notify-inbox-startup.sh",
-    ]
-    for h in wt_hooks:
-        p = root / "hooks" / "claude" / "worktree-coordination" / h
-        if not p.exists():
-            errors.append(
-                f"Missing worktree Claude hook: hooks/claude/worktree-coordination/{h}"
-            )
+        expected.setdefault(f"hooks/git/{hook}", "git hook")
 
-    # Templates
-    templates = [
-        "meta-process.yaml.example",
-        "plan.md.template",
-        "plans-index.md.template",
-        "issues.md.template",
-        "Makefile.meta",
-        "CLAUDE.md.root",
-        "CLAUDE.md.scripts",
-        "CLAUDE.md.tests",
-        "CLAUDE.md.docs-adr",
-        "doc_coupling.yaml.example",
-        "acceptance_gate.yaml.example",
-    ]
-    for t in templates:
-        if not (root / "templates" / t).exists():
-            errors.append(f"Missing template: templates/{t}")
+    for template in _install_template_re().findall(install_source):
+        expected.setdefault(f"templates/{template}", "template")
 
-    # Key documentation files
+    # Key documentation files and pattern index
     for doc in ["README.md", "GETTING_STARTED.md", "CLAUDE.md", "ISSUES.md"]:
-        if not (root / doc).exists():
-            errors.append(f"Missing documentation: {doc}")
+        expected.setdefault(doc, "documentation")
+    expected.setdefault("patterns/01_README.md", "pattern index")
 
-    # Pattern index
-    if not (root / "patterns" / "01_README.md").exists():
-        errors.append("Missing pattern index: patterns/01_README.md")
+    # Only walk the directories expected paths live in, not the whole root
+    subdirs = {path.split("/", 1)[0] for path in expected if "/" in path}
+    missing = expected.keys() - _relative_files(root, subdirs)
+    for path, label in expected.items():
+        if path in missing:
+            errors.append(f"Missing {label}: {path}")
 
     return errors
 
 
 # --- Check 2: Markdown Link Checker ---
 
-# Match [text](path) but not [text](https://...) or [text](http://...)
-LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
-# Match fenced code blocks (``` ... ```)
-CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+# Link targets that point outside the repo and are never checked
+EXTERNAL_PREFIXES = (b"http://", b"https://", b"mailto:")
+EXTERNAL_SCHEMES = ("http", "https", "mailto")
 
 
-def _in_code_block(content: str, pos: int) -> bool:
-    """Check if position is inside a fenced code block."""
-    for block in CODE_BLOCK_RE.finditer(content):
-        if block.start() <= pos < block.end():
-            return True
-    return False
+# Regexes are compiled on first use so --files/--install runs skip them
+@lru_cache(maxsize=None)
+def _link_re() -> re.Pattern[bytes]:
+    """Match [text](path); external URLs are filtered after matching."""
+    return re.compile(rb"\[([^\]]*)\]\(([^)]+)\)")
 
 
-def check_markdown_links(root: Path) -> list[str]:
-    """Verify all relative markdown links resolve to existing files."""
-    errors: list[str] = []
+@lru_cache(maxsize=None)
+def _code_block_re() -> re.Pattern[bytes]:
+    """Match fenced code blocks (``` ... ```)."""
+    return re.compile(rb"```.*?```", re.DOTALL)
+
+
+def _map_file(path: Path) -> mmap.mmap | None:
+    """Memory-map a file read-only, or return None if it is empty."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _code_block_spans(content: mmap.mmap) -> list[tuple[int, int]]:
+    """Return the (start, end) offsets of fenced code blocks, in order."""
+    return [block.span() for block in _code_block_re().finditer(content)]
+
+
+def _newline_offsets(content: mmap.mmap) -> list[int]:
+    """Return the byte offset of every newline in content."""
+    offsets: list[int] = []
+    pos = content.find(b"\n")
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find(b"\n", pos + 1)
+    return offsets
+
+
+@lru_cache(maxsize=None)
+def _resolve(path: str) -> Path:
+    """Resolve a link target path, cached across files."""
+    return Path(path).resolve()
+
 
-    for md_file in root.rglob("*.md"):
-        content = md_file.read_text(errors="replace")
-        rel_path = md_file.relative_to(root)
+def _snapshot_paths(root: Path) -> set[str]:
+    """Collect every file and directory under root in a single walk.
 
-        for match in LINK_RE.finditer(content):
-            link_text = match.group(1)
-            link_target = match.group(2)
+    SKIP_DIRS are listed but not descended into; links below them are checked
+    individually by the caller.
+    """
+    paths = {str(root)}
+    for dirpath, dirnames, filenames in os.walk(root):
+        for name in dirnames:
+            paths.add(os.path.join(dirpath, name))
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for name in filenames:
+            paths.add(os.path.join(dirpath, name))
+    return paths
 
-            # Skip external URLs
-            parsed = urlparse(link_target)
-            if parsed.scheme in ("http", "https", "mailto"):
+
+def _scan_file(
+    md_file: Path, root: Path, root_resolved: Path, all_paths: set[str]
+) -> tuple[list[str], bool]:
+    """Check the relative links in a single markdown file.
+
+    Returns the errors and whether they may be cached, which is not the case
+    when a link was checked against a SKIP_DIRS path outside the snapshot.
+    """
+    errors: list[str] = []
+    cacheable = True
+    content = _map_file(md_file)
+    if content is None:
+        return errors, cacheable
+    rel_path = md_file.relative_to(root)
+
+    with content:
+        blocks = _code_block_spans(content)
+        block_idx = 0
+        # Only needed to report line numbers, so built on the first error
+        newlines: list[int] | None = None
+
+        for match in _link_re().finditer(content):
+            group = match.group
+            pos = match.start()
+            raw_target = group(2)
+
+            # Skip external URLs (fast path for the common lowercase form)
+            if raw_target.startswith(EXTERNAL_PREFIXES):
                 continue
 
             # Skip anchor-only links
-            if link_target.startswith("#"):
+            if raw_target.startswith(b"#"):
                 continue
 
-            # Skip links inside code blocks (examples, not real refs)
-            if _in_code_block(content, match.start()):
+            # Skip links inside code blocks (examples, not real refs). Links
+            # arrive in offset order, so step past blocks that end before pos.
+            while block_idx < len(blocks) and blocks[block_idx][1] <= pos:
+                block_idx += 1
+            if block_idx < len(blocks) and blocks[block_idx][0] <= pos:
+                continue
+
+            # Catch external URLs the fast path misses (e.g. HTTPS://, " http://")
+            link_target = raw_target.decode("utf-8", "replace")
+            if ":" in link_target and urlparse(link_target).scheme in EXTERNAL_SCHEMES:
                 continue
 
             # Strip anchor from path
@@ -201,65 +277,182 @@ def check_markdown_links(root: Path) -> list[str]:
                 continue
 
             # Skip links that resolve outside the framework (to parent repo)
-            resolved = (md_file.parent / target_path).resolve()
+            resolved = _resolve(str(md_file.parent / target_path))
             try:
-                resolved.relative_to(root.resolve())
+                rel_target = resolved.relative_to(root_resolved)
             except ValueError:
                 # Link goes outside meta-process/ — can't validate
                 continue
 
-            if not resolved.exists():
-                line_num = content[: match.start()].count("\n") + 1
+            target = str(resolved)
+            if target not in all_paths:
+                # The snapshot skips SKIP_DIRS contents; stat those rare links
+                if not SKIP_DIRS.isdisjoint(rel_target.parts):
+                    cacheable = False
+                    if os.path.exists(target):
+                        continue
+                if newlines is None:
+                    newlines = _newline_offsets(content)
+                line_num = bisect_left(newlines, pos) + 1
+                link_text = group(1).decode("utf-8", "replace")
                 errors.append(
                     f"{rel_path}:{line_num}: broken link [{link_text}]({link_target})"
                 )
 
-    return errors
-
+    return errors, cacheable
+
+
+def _find_markdown(root: Path) -> list[Path]:
+    """List markdown files under root, pruning VCS, dependency and build dirs."""
+    md_files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for name in filenames:
+            if name.endswith(".md"):
+                md_files.append(Path(dirpath) / name)
+    return md_files
+
+
+# Per-file link results, stored in _cache_dir()
+LINK_CACHE_NAME = "linkcache.json"
+
+
+def _link_cache_key(all_paths: set[str]) -> str:
+    """Hash the tree layout and this script; results are only valid for both.
+
+    A file's broken links depend on which targets exist, not just on its own
+    contents, so any added or removed path invalidates the whole cache. The
+    snapshot skips SKIP_DIRS, so churn under .git or node_modules does not.
+    """
+    digest = hashlib.sha256(Path(__file__).read_bytes())
+    digest.update("\0".join(sorted(all_paths)).encode())
+    return digest.hexdigest()
+
+
+def _load_link_cache(key: str) -> dict[str, list[Any]]:
+    """Load cached per-file results, or nothing if the tree has changed."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return {}
+    try:
+        data = json.loads((cache_dir / LINK_CACHE_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("key") != key:
+        return {}
+    files: dict[str, list[Any]] = data.get("files", {})
+    return files
+
+
+def _save_link_cache(key: str, files: dict[str, list[Any]]) -> None:
+    """Persist per-file results; caching is best-effort."""
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        (cache_dir / LINK_CACHE_NAME).write_text(
+            json.dumps({"key": key, "files": files})
+        )
+    except OSError:
+        pass
 
-# --- Check 3: Install Test ---
 
+def check_markdown_links(root: Path, force: bool = False) -> list[str]:
+    """Verify all relative markdown links resolve to existing files.
 
-def check_install(root: Path) -> list[str]:
-    """Install to temp dir, make a commit, verify hooks work."""
+    Files whose mtime and size are unchanged since the last run reuse their
+    cached result, unless force is set.
+    """
     errors: list[str] = []
+    root_resolved = root.resolve()
+    all_paths = _snapshot_paths(root_resolved)
+    md_files = _find_markdown(root)
+    cache_key = _link_cache_key(all_paths)
+    cached = {} if force else _load_link_cache(cache_key)
+    # path -> [st_mtime_ns, st_size, errors]
+    results: dict[str, list[Any]] = {}
+
+    def scan(md_file: Path) -> list[str]:
+        st = md_file.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cached.get(str(md_file))
+        if entry is not None and entry[:2] == stamp:
+            file_errors: list[str] = entry[2]
+            cacheable = True
+        else:
+            file_errors, cacheable = _scan_file(
+                md_file, root, root_resolved, all_paths
+            )
+        if cacheable:
+            results[str(md_file)] = [*stamp, file_errors]
+        return file_errors
 
-    with tempfile.TemporaryDirectory(prefix="meta-process-test-") as tmpdir:
-        tmp = Path(tmpdir)
-        project = tmp / "test-project"
-        project.mkdir()
-
-        # Initialize git repo
-        _run(["git", "init", str(project)])
-        _run(["git", "-C", str(project), "config", "user.email", "test@test.com"])
-        _run(["git", "-C", str(project), "config", "user.name", "Test"])
-
-        # Create initial commit so we have a branch
-        readme = project / "README.md"
-        readme.write_text("# Test Project\n")
-        _run(["git", "-C", str(project), "add", "README.md"])
-        _run(
-            [
-                "git",
-                "-C",
-                str(project),
-                "commit",
-                "--no-verify",
-                "-m",
-                "Initial commit",
-            ]
-        )
+    # Per-file work is mostly I/O (read + path resolution), so threads overlap it
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as pool:
+        for file_errors in pool.map(scan, md_files):
+            errors.extend(file_errors)
 
-        # Run minimal install
-        install_script = str(root / "install.sh")
-        result = subprocess.run(
-            ["bash", install_script, str(project), "--minimal"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            errors.append(f"install.sh --minimal failed:\n{result.stderr}")
-            return errors
+    _save_link_cache(cache_key, results)
+    return errors
+
+
+# --- Check 3: Install Test ---
+
+# Framework paths whose contents determine what install.sh produces
+INSTALL_INPUTS = ("install.sh", "hooks", "scripts", "templates", "patterns")
+# Identity for commits made in the throwaway test repos
+TEST_NAME = "Test"
+TEST_EMAIL = "test@test.com"
+
+
+def _git_env() -> dict[str, str]:
+    """Environment giving test commits an identity without per-repo config."""
+    return {
+        **os.environ,
+        "GIT_AUTHOR_NAME": TEST_NAME,
+        "GIT_AUTHOR_EMAIL": TEST_EMAIL,
+        "GIT_COMMITTER_NAME": TEST_NAME,
+        "GIT_COMMITTER_EMAIL": TEST_EMAIL,
+    }
+
+
+def _init_repo(path: Path) -> None:
+    """Create a git repo at path with one commit so it has a branch."""
+    path.mkdir()
+    _run(["git", "init", "-b", "main", str(path)])
+    (path / "README.md").write_text("# Test Project\n")
+    _run(["git", "-C", str(path), "add", "README.md"])
+    # Identity comes from the environment, saving two `git config` processes
+    subprocess.run(
+        ["git", "-C", str(path), "commit", "--no-verify", "-m", "Initial commit"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=_git_env(),
+        check=True,
+    )
+
+
+def _check_minimal_install(root: Path, project: Path) -> list[str]:
+    """Run install.sh --minimal and verify files, hooks path and commit hooks."""
+    errors: list[str] = []
+    _init_repo(project)
+
+    result = subprocess.run(
+        ["bash", str(root / "install.sh"), str(project), "--minimal"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors.append(f"install.sh --minimal failed:\n{result.stderr}")
+        return errors
+
+    # The hooks path read does not touch the index, so it runs alongside the
+    # commit tests. Those two stay sequential: they share one index and HEAD,
+    # and a separate worktree would not see the uncommitted installed hooks.
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        hooks_path = pool.submit(_check_hooks_path, project)
+        commits = pool.submit(_check_commit_hooks, project)
 
         # Verify expected files exist
         expected_files = [
@@ -277,98 +470,152 @@ def check_install(root: Path) -> list[str]:
             ".claude/hooks/gate-edit.sh",
             ".claude/hooks/post-edit-quiz.sh",
         ]
+        project_str = str(project)
         for f in expected_files:
-            if not (project / f).exists():
+            if not os.path.isfile(os.path.join(project_str, f)):
                 errors.append(f"Minimal install missing: {f}")
 
-        # Verify git hooks path is set
-        result = subprocess.run(
-            ["git", "-C", str(project), "config", "core.hooksPath"],
-            capture_output=True,
-            text=True,
-        )
-        if result.stdout.strip() != "hooks":
-            errors.append(
-                f"Git hooks path not set correctly: '{result.stdout.strip()}'"
-            )
+        errors.extend(hooks_path.result())
+        errors.extend(commits.result())
 
-        # Test 1: Good commit message should succeed
-        test_file = project / "test.txt"
-        test_file.write_text("hello\n")
-        _run(["git", "-C", str(project), "add", "test.txt"])
-        result = subprocess.run(
-            ["git", "-C", str(project), "commit", "-m", "[Trivial] Test commit"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode != 0:
-            errors.append(
-                f"Good commit blocked by hooks:\nstdout: {result.stdout}\nstderr: {result.stderr}"
-            )
+    return errors
 
-        # Test 2: Bad commit message should be rejected
-        test_file.write_text("hello again\n")
-        _run(["git", "-C", str(project), "add", "test.txt"])
-        result = subprocess.run(
-            ["git", "-C", str(project), "commit", "-m", "bad message no prefix"],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0:
-            errors.append("Bad commit message was NOT rejected by commit-msg hook")
-
-        # Test 3: Full install
-        project2 = tmp / "test-project-full"
-        project2.mkdir()
-        _run(["git", "init", str(project2)])
-        _run(["git", "-C", str(project2), "config", "user.email", "test@test.com"])
-        _run(["git", "-C", str(project2), "config", "user.name", "Test"])
-        readme2 = project2 / "README.md"
-        readme2.write_text("# Test\n")
-        _run(["git", "-C", str(project2), "add", "README.md"])
-        _run(
-            [
-                "git",
-                "-C",
-                str(project2),
-                "commit",
-                "--no-verify",
-                "-m",
-                "Initial",
-            ]
-        )
 
-        result = subprocess.run(
-            ["bash", install_script, str(project2), "--full"],
-            capture_output=True,
-            text=True,
+def _check_hooks_path(project: Path) -> list[str]:
+    """Verify install.sh pointed core.hooksPath at the installed hooks."""
+    errors: list[str] = []
+    result = subprocess.run(
+        ["git", "-C", str(project), "config", "core.hooksPath"],
+        capture_output=True,
+        text=True,
+    )
+    if result.stdout.strip() != "hooks":
+        errors.append(f"Git hooks path not set correctly: '{result.stdout.strip()}'")
+    return errors
+
+
+def _check_commit_hooks(project: Path) -> list[str]:
+    """Verify the commit-msg hook accepts good messages and rejects bad ones."""
+    errors: list[str] = []
+
+    # Test 1: Good commit message should succeed
+    test_file = project / "test.txt"
+    test_file.write_text("hello\n")
+    _run(["git", "-C", str(project), "add", "test.txt"])
+    result = subprocess.run(
+        ["git", "-C", str(project), "commit", "-m", "[Trivial] Test commit"],
+        capture_output=True,
+        text=True,
+        env=_git_env(),
+    )
+    if result.returncode != 0:
+        errors.append(
+            f"Good commit blocked by hooks:\nstdout: {result.stdout}\nstderr: {result.stderr}"
         )
-        if result.returncode != 0:
-            errors.append(f"install.sh --full failed:\n{result.stderr}")
-            return errors
-
-        full_expected = [
-            "acceptance_gates/EXAMPLE.yaml",
-            "scripts/relationships.yaml",
-            ".claude/hooks/protect-main.sh",
-            ".claude/hooks/check-references-reviewed.sh",
-            ".claude/hooks/worktree-coordination/block-cd-worktree.sh",
-            "scripts/meta/check_doc_coupling.py",
-            "scripts/meta/worktree-coordination/check_claims.py",
-            "docs/meta-patterns/01_README.md",
-            "docs/meta-patterns/worktree-coordination/18_claim-system.md",
-            "docs/adr/CLAUDE.md",
-        ]
-        for f in full_expected:
-            if not (project2 / f).exists():
-                errors.append(f"Full install missing: {f}")
+
+    # Test 2: Bad commit message should be rejected
+    test_file.write_text("hello again\n")
+    _run(["git", "-C", str(project), "add", "test.txt"])
+    result = subprocess.run(
+        ["git", "-C", str(project), "commit", "-m", "bad message no prefix"],
+        capture_output=True,
+        text=True,
+        env=_git_env(),
+    )
+    if result.returncode == 0:
+        errors.append("Bad commit message was NOT rejected by commit-msg hook")
+
+    return errors
+
+
+def _check_full_install(root: Path, project: Path) -> list[str]:
+    """Run install.sh --full and verify the full-mode files were installed."""
+    errors: list[str] = []
+    _init_repo(project)
+
+    result = subprocess.run(
+        ["bash", str(root / "install.sh"), str(project), "--full"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        errors.append(f"install.sh --full failed:\n{result.stderr}")
+        return errors
+
+    full_expected = [
+        "acceptance_gates/EXAMPLE.yaml",
+        "scripts/relationships.yaml",
+        ".claude/hooks/protect-main.sh",
+        ".claude/hooks/check-references-reviewed.sh",
+        ".claude/hooks/worktree-coordination/block-cd-worktree.sh",
+        "scripts/meta/check_doc_coupling.py",
+        "scripts/meta/worktree-coordination/check_claims.py",
+        "docs/meta-patterns/01_README.md",
+        "docs/meta-patterns/worktree-coordination/18_claim-system.md",
+        "docs/adr/CLAUDE.md",
+    ]
+    project_str = str(project)
+    for f in full_expected:
+        if not os.path.isfile(os.path.join(project_str, f)):
+            errors.append(f"Full install missing: {f}")
+
+    return errors
+
+
+def _install_inputs_key(root: Path) -> str:
+    """Hash every framework file that install.sh copies or reads."""
+    digest = hashlib.sha256()
+    for name in INSTALL_INPUTS:
+        path = root / name
+        files = [path] if path.is_file() else sorted(path.rglob("*"))
+        for f in files:
+            if not f.is_file() or "__pycache__" in f.parts:
+                continue
+            digest.update(f.relative_to(root).as_posix().encode())
+            digest.update(b"\0")
+            digest.update(f.read_bytes())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def check_install(root: Path, force: bool = False) -> list[str] | None:
+    """Install to temp dir, make a commit, verify hooks work.
+
+    Returns None without running when the install inputs are unchanged since
+    the last passing run, unless force is set.
+    """
+    errors: list[str] = []
+    cache_dir = _cache_dir()
+    sentinel = None
+    if cache_dir is not None:
+        sentinel = cache_dir / f"{_install_inputs_key(root)}.ok"
+        if sentinel.exists() and not force:
+            return None
+
+    with tempfile.TemporaryDirectory(prefix="meta-process-test-") as tmpdir:
+        tmp = Path(tmpdir)
+        # The two installs use separate repos, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            minimal = pool.submit(_check_minimal_install, root, tmp / "test-project")
+            full = pool.submit(_check_full_install, root, tmp / "test-project-full")
+            errors.extend(minimal.result())
+            errors.extend(full.result())
+
+    if not errors and sentinel is not None:
+        try:
+            sentinel.parent.mkdir(parents=True, exist_ok=True)
+            sentinel.touch()
+        except OSError:
+            pass  # Caching is best-effort; an unwritable cache just means no skip
 
     return errors
 
 
 def _run(cmd: list[str]) -> subprocess.CompletedProcess[str]:
-    """Run a command, raising on failure."""
-    return subprocess.run(cmd, capture_output=True, text=True, check=True)
+    """Run a command whose output is never read, raising on failure."""
+    return subprocess.run(
+        cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True, check=True
+    )
 
 
 # --- Main ---
@@ -379,6 +626,14 @@ def main() -> None:
     parser.add_argument("--files", action="store_true", help="File existence check only")
     parser.add_argument("--links", action="store_true", help="Link checker only")
     parser.add_argument("--install", action="store_true", help="Install test only")
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop after the first failing check"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Ignore cached link and install results and re-run everything",
+    )
     args = parser.parse_args()
 
     # If no flags, run all
@@ -390,23 +645,28 @@ def main() -> None:
 
     all_errors: list[str] = []
 
-    if run_all or args.files:
-        print("=== File Existence Check ===")
-        errors = check_file_existence(root)
-        _report(errors)
-        all_errors.extend(errors)
-
-    if run_all or args.links:
-        print("=== Markdown Link Check ===")
-        errors = check_markdown_links(root)
-        _report(errors)
-        all_errors.extend(errors)
-
-    if run_all or args.install:
-        print("=== Install Test ===")
-        errors = check_install(root)
+    checks = [
+        (args.files, "File Existence Check", check_file_existence),
+        (
+            args.links,
+            "Markdown Link Check",
+            lambda r: check_markdown_links(r, args.force),
+        ),
+        (args.install, "Install Test", lambda r: check_install(r, args.force)),
+    ]
+    for selected, title, check in checks:
+        if not (run_all or selected):
+            continue
+        print(f"=== {title} ===")
+        errors = check(root)
+        if errors is None:
+            print("  SKIPPED (inputs unchanged since last pass; use --force to re-run)")
+            print()
+            continue
         _report(errors)
         all_errors.extend(errors)
+        if args.fail_fast and errors:
+            break
 
     print()
     if all_errors: